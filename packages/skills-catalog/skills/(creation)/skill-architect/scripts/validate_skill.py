@@ -6,6 +6,8 @@ Usage:
     python scripts/validate_skill.py <path-to-skill-folder>
     python scripts/validate_skill.py <path-to-skill-folder> --format json
     python scripts/validate_skill.py <path-to-skill-folder> --json-out /tmp/skill-report.json
+    python scripts/validate_skill.py <path-to-skill-folder> --compile
+    python scripts/validate_skill.py --batch skills.txt --json-out /tmp/skills-report.json
 
 Exit codes:
     0 = pass (warnings allowed)
@@ -14,25 +16,131 @@ Exit codes:
 Token-efficient workflow:
     Run once with --json-out, then reuse the saved JSON for feedback/review
     without re-running validation.
+
+CI workflow:
+    --batch FILE validates newline-delimited skill paths from FILE (or - for
+    stdin) in a single process and emits one JSON array of reports.
+
+    --compile stores the parsed frontmatter in .skill-fm-cache.json next to
+    SKILL.md after a passing run. Later runs load it instead of re-parsing
+    while the raw frontmatter text is unchanged and the same frontmatter
+    parser backend is active.
 """
 
 import argparse
+import dataclasses
+import functools
+import hashlib
 import json
 import os
 import re
 import sys
-from typing import Any
+import tempfile
+from typing import Any, Optional, TextIO
 
 try:
     import yaml  # type: ignore[reportMissingImports]
 except ImportError:
     yaml = None
 
+if yaml is not None:
+    # Prefer the LibYAML C bindings; PyYAML builds without them fall back to pure Python.
+    try:
+        from yaml import CSafeLoader as _YamlLoader  # type: ignore[reportMissingImports]
+
+        _YAML_PARSER_MODE = "pyyaml-libyaml"
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader  # type: ignore[reportMissingImports]
+
+        _YAML_PARSER_MODE = "pyyaml-pure"
+
+# Backend parse_frontmatter() uses in this environment.
+_ACTIVE_PARSER_MODE = _YAML_PARSER_MODE if yaml is not None else "stdlib"
+
+# Regex sources keyed by name. Compiled patterns live in _PATTERNS and are looked
+# up by name at call time, so tests can swap a pattern without touching callers.
+_PATTERN_SOURCES: dict[str, tuple[str, int]] = {
+    "key": (r"^([A-Za-z0-9_-]+)\s*:\s*(.*)$", 0),
+    "int": (r"-?\d+", 0),
+    "float": (r"-?\d+\.\d+", 0),
+}
+_PATTERNS: dict[str, re.Pattern[str]] = {}
+
+
+def precompile_patterns() -> dict[str, re.Pattern[str]]:
+    """
+    Compile every validator regex that is not compiled yet.
+
+    Runs at import time; library callers may invoke it again to restore any
+    pattern removed from _PATTERNS. Returns the compiled patterns by name.
+    """
+    for name, (source, flags) in _PATTERN_SOURCES.items():
+        if name not in _PATTERNS:
+            _PATTERNS[name] = re.compile(source, flags)
+    return _PATTERNS
+
+
+precompile_patterns()
+
+# Body checks are plain substring scans against the lowercased body.
+# "if ... fails" needs no pattern of its own: any match already contains "fail".
+_EXAMPLE_TOKENS = ("example", "user says", "result:")
+_ERROR_TOKENS = ("error", "fail", "troubleshoot", "issue", "problem")
+
+# Description checks run against the lowercased description.
+TRIGGER_KEYWORDS = ("use when", "use for", "use this", "trigger", "ask for", "asks to", "says", "mentions")
+NEGATIVE_KEYWORDS = ("do not use", "don't use", "not for", "not intended for")
+
+FM_CACHE_FILENAME = ".skill-fm-cache.json"
+
+_BLOCK_MARKERS = frozenset({"|", ">", "|-", ">-"})
+_KEY_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-")
+
 
 class FrontmatterParseError(ValueError):
     """Raised when frontmatter parsing fails."""
 
 
+@dataclasses.dataclass(frozen=True)
+class CheckResult:
+    """Outcome of a single validation check."""
+
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10.
+    __slots__ = ("name", "passed", "message", "severity")
+
+    name: str
+    passed: bool
+    message: str
+    severity: str
+
+    def __reduce__(self):
+        # Frozen fields can't be restored via setattr, which copy/pickle use for slotted classes.
+        return (CheckResult, (self.name, self.passed, self.message, self.severity))
+
+
+def json_default(obj: Any) -> Any:
+    """Serialize CheckResult records: json.dumps(validate_skill(path), default=json_default)."""
+    if isinstance(obj, CheckResult):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _is_kebab(value: str) -> bool:
+    """Return True if value is lowercase ASCII kebab-case, e.g. "my-skill-2"."""
+    # Starting as if after a dash rejects empty input and a leading dash.
+    prev_dash = True
+    for c in value:
+        if c == "-":
+            if prev_dash:
+                return False
+            prev_dash = True
+        elif "a" <= c <= "z" or "0" <= c <= "9":
+            prev_dash = False
+        else:
+            return False
+    return not prev_dash
+
+
 def _parse_scalar(raw: str) -> Any:
     """Parse a scalar YAML-like value using stdlib-only rules."""
     value = raw.strip()
@@ -49,9 +157,9 @@ def _parse_scalar(raw: str) -> Any:
         return False
     if lower in {"null", "none", "~"}:
         return None
-    if re.fullmatch(r"-?\d+", value):
+    if _PATTERNS["int"].fullmatch(value):
         return int(value)
-    if re.fullmatch(r"-?\d+\.\d+", value):
+    if _PATTERNS["float"].fullmatch(value):
         return float(value)
     return value
 
@@ -59,6 +167,7 @@ def _parse_scalar(raw: str) -> Any:
 def _collect_block_scalar(lines: list[str], start_idx: int, min_indent: int, folded: bool) -> tuple[str, int]:
     """Collect YAML block scalar lines (| or >) from start_idx."""
     block_lines: list[str] = []
+    indent_prefix = " " * min_indent
     i = start_idx
 
     while i < len(lines):
@@ -68,8 +177,9 @@ def _collect_block_scalar(lines: list[str], start_idx: int, min_indent: int, fol
             i += 1
             continue
 
-        indent = len(line) - len(line.lstrip(" "))
-        if indent < min_indent:
+        # Only the "indented at least min_indent" test matters, so check the
+        # prefix instead of measuring the indent with a stripped copy.
+        if not line.startswith(indent_prefix):
             break
 
         block_lines.append(line[min_indent:])
@@ -111,10 +221,6 @@ def _parse_frontmatter_stdlib(frontmatter_raw: str) -> dict[str, Any]:
     data: dict[str, Any] = {}
     i = 0
 
-    top_key_pattern = re.compile(r"^([A-Za-z0-9_-]+)\s*:\s*(.*)$")
-    nested_key_pattern = re.compile(r"^([A-Za-z0-9_-]+)\s*:\s*(.*)$")
-    block_markers = {"|", ">", "|-", ">-"}
-
     while i < len(lines):
         line = lines[i]
         stripped = line.strip()
@@ -125,13 +231,13 @@ def _parse_frontmatter_stdlib(frontmatter_raw: str) -> dict[str, Any]:
         if line.startswith(" "):
             raise FrontmatterParseError(f"Unexpected indentation at top level near line {i + 1}: {line}")
 
-        top_match = top_key_pattern.match(line)
+        top_match = _PATTERNS["key"].match(line)
         if not top_match:
             raise FrontmatterParseError(f"Invalid top-level entry near line {i + 1}: {line}")
 
         key, raw_value = top_match.group(1), top_match.group(2).strip()
 
-        if raw_value in block_markers:
+        if raw_value in _BLOCK_MARKERS:
             folded = raw_value.startswith(">")
             parsed_block, next_idx = _collect_block_scalar(lines, i + 1, min_indent=2, folded=folded)
             data[key] = parsed_block
@@ -185,12 +291,12 @@ def _parse_frontmatter_stdlib(frontmatter_raw: str) -> dict[str, Any]:
                     f"List syntax is not supported by fallback parser near line {k + 1}. Install PyYAML for full support."
                 )
 
-            nested_match = nested_key_pattern.match(nested_content)
+            nested_match = _PATTERNS["key"].match(nested_content)
             if not nested_match:
                 raise FrontmatterParseError(f"Invalid nested mapping near line {k + 1}: {nested_line}")
 
             child_key, child_raw = nested_match.group(1), nested_match.group(2).strip()
-            if child_raw in block_markers:
+            if child_raw in _BLOCK_MARKERS:
                 folded = child_raw.startswith(">")
                 child_block, next_k = _collect_block_scalar(lines, k + 1, min_indent=4, folded=folded)
                 nested_data[child_key] = child_block
@@ -205,22 +311,278 @@ def _parse_frontmatter_stdlib(frontmatter_raw: str) -> dict[str, Any]:
     return data
 
 
+def _split_key_value(line: str) -> Optional[tuple[str, str]]:
+    """Split an unindented `key: value` line, or return None if the key is invalid."""
+    key, sep, value = line.partition(":")
+    key = key.rstrip()
+    if not sep or not key or not _KEY_CHARS.issuperset(key):
+        return None
+    return key, value.strip()
+
+
+def _parse_frontmatter_flat(frontmatter_raw: str) -> Optional[dict[str, Any]]:
+    """
+    Single-pass parser for the common flat frontmatter shape.
+
+    Handles top-level `key: value` pairs and one-level nested mappings of plain
+    scalars. Returns None as soon as it meets anything else (block scalars,
+    lists, deeper nesting, malformed lines) so the caller can fall back to
+    `_parse_frontmatter_stdlib`, which also produces the error messages.
+    """
+    data: dict[str, Any] = {}
+    parent_key: Optional[str] = None
+
+    for line in frontmatter_raw.splitlines():
+        stripped = line.strip()
+        if stripped == "" or stripped.startswith("#"):
+            continue
+
+        if line.startswith(" "):
+            if parent_key is None or not line.startswith("  ") or line.startswith("   "):
+                return None
+            pair = _split_key_value(line[2:])
+            if pair is None or pair[1] in _BLOCK_MARKERS:
+                return None
+            parent = data[parent_key]
+            if not isinstance(parent, dict):
+                parent = data[parent_key] = {}
+            parent[pair[0]] = _parse_scalar(pair[1])
+            continue
+
+        pair = _split_key_value(line)
+        if pair is None:
+            return None
+        key, raw_value = pair
+        if raw_value in _BLOCK_MARKERS or raw_value.startswith("- "):
+            return None
+        if raw_value == "":
+            # Stays "" unless nested children follow.
+            data[key] = ""
+            parent_key = key
+        else:
+            data[key] = _parse_scalar(raw_value)
+            parent_key = None
+
+    return data
+
+
+def _is_delimiter(line: str) -> bool:
+    """Return True for a complete `---` line (trailing whitespace allowed)."""
+    return line.endswith("\n") and line.rstrip() == "---"
+
+
+def read_frontmatter(f: TextIO) -> Optional[str]:
+    """
+    Read the frontmatter block line by line from an open SKILL.md.
+
+    Stops at the closing `---` so the file is left positioned at the body.
+    Returns None when the delimiters are missing or malformed.
+
+    Whitespace-only lines right after the opening delimiter are skipped, and
+    the first line after them is always frontmatter content, even if it is a
+    `---` line. Only when no later delimiter exists does such a `---` close the
+    block, whose content is then the last skipped line (the file is rewound to
+    just after that `---`).
+    """
+    if not _is_delimiter(f.readline()):
+        return None
+
+    fm_lines: list[str] = []
+    last_blank: Optional[str] = None
+    blank_block_end: Optional[int] = None
+    while True:
+        line = f.readline()
+        if line == "":
+            if blank_block_end is None:
+                return None
+            f.seek(blank_block_end)
+            return last_blank
+        if not fm_lines:
+            if line.strip() == "":
+                last_blank = line[:-1]
+                continue
+            if last_blank is not None and _is_delimiter(line):
+                blank_block_end = f.tell()
+        elif _is_delimiter(line):
+            return "\n".join(fm_lines)
+        fm_lines.append(line[:-1])
+
+
 def parse_frontmatter(frontmatter_raw: str) -> tuple[dict[str, Any], str]:
-    """Parse frontmatter using PyYAML when available, fallback to stdlib parser."""
+    """
+    Parse frontmatter using PyYAML when available, fallback to stdlib parser.
+
+    The returned parser mode is "pyyaml-libyaml", "pyyaml-pure" or "stdlib".
+    """
     if yaml is not None:
-        parsed = yaml.safe_load(frontmatter_raw)
+        parsed = yaml.load(frontmatter_raw, Loader=_YamlLoader)
         if not isinstance(parsed, dict):
             raise FrontmatterParseError("Frontmatter is not a YAML mapping")
-        return parsed, "pyyaml"
+        return parsed, _YAML_PARSER_MODE
 
-    parsed = _parse_frontmatter_stdlib(frontmatter_raw)
+    parsed = _parse_frontmatter_flat(frontmatter_raw)
+    if parsed is None:
+        parsed = _parse_frontmatter_stdlib(frontmatter_raw)
     if not isinstance(parsed, dict):
         raise FrontmatterParseError("Frontmatter is not a mapping")
     return parsed, "stdlib"
 
 
+def _frontmatter_digest(frontmatter_raw: str) -> str:
+    """Return the sha256 hex digest identifying a raw frontmatter block."""
+    return hashlib.sha256(frontmatter_raw.encode("utf-8")).hexdigest()
+
+
+def load_frontmatter_cache(skill_path: str, frontmatter_raw: str) -> Optional[tuple[dict[str, Any], str]]:
+    """
+    Return (frontmatter, parser_mode) from the JSON sidecar, or None if unusable.
+
+    The sidecar is only trusted if it was built from the same raw frontmatter
+    text (mtime and size survive `cp -p`/`rsync -a` edits, content does not)
+    and by the active parser backend; a stdlib-parsed sidecar must not vouch
+    for frontmatter that PyYAML would reject.
+    """
+    try:
+        with open(os.path.join(skill_path, FM_CACHE_FILENAME), "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(payload, dict) or payload.get("frontmatter_sha256") != _frontmatter_digest(frontmatter_raw):
+        return None
+    if payload.get("parser_mode") != _ACTIVE_PARSER_MODE:
+        return None
+    fm = payload.get("frontmatter")
+    if not isinstance(fm, dict):
+        return None
+    return fm, _ACTIVE_PARSER_MODE
+
+
+def write_frontmatter_cache(skill_path: str, fm_raw: str, fm: dict[str, Any], parser_mode: str) -> str:
+    """
+    Store already-validated frontmatter in the JSON sidecar. Returns the sidecar path.
+
+    Raises FrontmatterParseError if the frontmatter is not JSON-serializable
+    (e.g. non-string mapping keys); no sidecar is written then.
+    """
+    cache_path = os.path.join(skill_path, FM_CACHE_FILENAME)
+    payload = {
+        "frontmatter_sha256": _frontmatter_digest(fm_raw),
+        "parser_mode": parser_mode,
+        "frontmatter": fm,
+    }
+    try:
+        # default=str keeps YAML-only value types (e.g. dates) serializable; keys are not covered.
+        payload_json = json.dumps(payload, separators=(",", ":"), default=str)
+    except (TypeError, ValueError) as e:
+        raise FrontmatterParseError(f"Frontmatter cannot be cached as JSON: {e}") from e
+
+    # Write to a temp file in the same folder and rename, so readers never see a partial sidecar.
+    fd, tmp_path = tempfile.mkstemp(prefix=FM_CACHE_FILENAME, suffix=".tmp", dir=skill_path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as out_file:
+            out_file.write(payload_json)
+        # mkstemp creates the file as 0600; give it the mode open() would have.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return cache_path
+
+
 def validate_skill(skill_path: str) -> dict:
-    """Run all validation checks on a skill folder."""
+    """
+    Run all validation checks on a skill folder.
+
+    `checks` holds CheckResult records, so serialize the report with
+    `json.dumps(report, default=json_default)`.
+
+    Results are cached per process, keyed on the folder listing and the
+    SKILL.md mtime/size, so re-validating an unchanged skill skips reading
+    and parsing it again.
+    """
+    return _validate_skill_with_frontmatter(skill_path)[0]
+
+
+def _validate_skill_with_frontmatter(skill_path: str) -> tuple[dict, Optional[tuple[str, dict[str, Any], str]]]:
+    """
+    Like validate_skill(), but also return the parsed frontmatter.
+
+    The second item is (fm_raw, fm, parser_mode) once frontmatter parsed
+    successfully, else None; --compile writes the sidecar from it.
+    """
+    try:
+        entries, skill_md_stat, refs = _snapshot_skill_folder(skill_path)
+    except OSError as e:
+        return _unreadable_folder_report(skill_path, e), None
+
+    # Hand out a copy so callers can't mutate the cached report. CheckResult
+    # records are frozen, so copying the lists is enough.
+    cached, frontmatter = _validate_skill_cached(skill_path, entries, skill_md_stat, refs)
+    return {**cached, "checks": list(cached["checks"]), "next_steps": list(cached["next_steps"])}, frontmatter
+
+
+def _snapshot_skill_folder(
+    skill_path: str,
+) -> tuple[Optional[tuple[str, ...]], Optional[tuple[int, int]], Optional[tuple[str, ...]]]:
+    """Collect (entries, SKILL.md (mtime_ns, size), references/ listing) for a skill folder."""
+    entries: Optional[tuple[str, ...]] = None
+    skill_md_stat: Optional[tuple[int, int]] = None
+    refs: Optional[tuple[str, ...]] = None
+
+    # scandir's DirEntry caches the file type, so is_dir() needs no extra stat.
+    try:
+        with os.scandir(skill_path) as it:
+            entries_list = list(it)
+    except (FileNotFoundError, NotADirectoryError):
+        entries_list = None
+
+    if entries_list is not None:
+        entries = tuple(e.name for e in entries_list)
+        entry_is_dir = {e.name: e.is_dir() for e in entries_list}
+        if "SKILL.md" in entry_is_dir:
+            st = os.stat(os.path.join(skill_path, "SKILL.md"))
+            skill_md_stat = (st.st_mtime_ns, st.st_size)
+        if entry_is_dir.get("references"):
+            refs = tuple(os.listdir(os.path.join(skill_path, "references")))
+
+    return entries, skill_md_stat, refs
+
+
+def _unreadable_folder_report(skill_path: str, error: OSError) -> dict:
+    """Build a failing report for a skill folder that could not be listed or stat'ed."""
+    return {
+        "path": skill_path,
+        "checks": [CheckResult("folder_readable", False, f"Cannot read skill folder: {error}", "error")],
+        "passed": 0,
+        "failed": 1,
+        "warnings": 0,
+        "parser_mode": "unknown",
+        "next_steps": [],
+        "summary": "FAIL — skill folder unreadable",
+    }
+
+
+@functools.lru_cache(maxsize=2000)
+def _validate_skill_cached(
+    skill_path: str,
+    entries: Optional[tuple[str, ...]],
+    skill_md_stat: Optional[tuple[int, int]],
+    refs: Optional[tuple[str, ...]],
+) -> tuple[dict, Optional[tuple[str, dict[str, Any], str]]]:
+    """
+    Validate a skill folder from a pre-collected snapshot.
+
+    Returns the report plus (fm_raw, fm, parser_mode) once frontmatter parsed,
+    else None.
+
+    `entries` is the folder listing (None if the path is not a directory) and
+    `refs` the references/ listing (None if absent). `skill_md_stat` is the
+    SKILL.md (mtime_ns, size) pair and only serves as part of the cache key.
+    """
     results = {
         "path": skill_path,
         "checks": [],
@@ -232,12 +594,7 @@ def validate_skill(skill_path: str) -> dict:
     }
 
     def add_check(name: str, passed: bool, message: str, severity: str = "error"):
-        results["checks"].append({
-            "name": name,
-            "passed": passed,
-            "message": message,
-            "severity": severity,
-        })
+        results["checks"].append(CheckResult(name, passed, message, severity))
         if passed:
             results["passed"] += 1
         elif severity == "warning":
@@ -246,16 +603,15 @@ def validate_skill(skill_path: str) -> dict:
             results["failed"] += 1
 
     # --- Check 1: Folder exists ---
-    if not os.path.isdir(skill_path):
+    if entries is None:
         add_check("folder_exists", False, f"Path is not a directory: {skill_path}")
         results["summary"] = "FAIL — folder not found"
-        return results
+        return results, None
     add_check("folder_exists", True, "Skill folder exists")
 
     # --- Check 2: Folder name is kebab-case ---
     folder_name = os.path.basename(os.path.normpath(skill_path))
-    kebab_pattern = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
-    is_kebab = bool(kebab_pattern.match(folder_name))
+    is_kebab = _is_kebab(folder_name)
     add_check(
         "folder_kebab_case",
         is_kebab,
@@ -263,21 +619,24 @@ def validate_skill(skill_path: str) -> dict:
     )
 
     # --- Check 3: SKILL.md exists (exact casing) ---
-    entries = os.listdir(skill_path)
     has_skill_md = "SKILL.md" in entries
     add_check("skill_md_exists", has_skill_md, "SKILL.md exists" if has_skill_md else "SKILL.md not found (case-sensitive)")
 
+    # Lowercased name -> entry; the exact SKILL.md is left out so that any
+    # "skill.md" key is a wrong casing variant.
+    entries_lower = {e.lower(): e for e in entries if e != "SKILL.md"}
+
     # Check for wrong casing variants
-    wrong_casings = [e for e in entries if e.lower() == "skill.md" and e != "SKILL.md"]
-    if wrong_casings:
-        add_check("skill_md_casing", False, f"Found wrong casing: {wrong_casings[0]} (must be exactly SKILL.md)")
+    wrong_casing = entries_lower.get("skill.md")
+    if wrong_casing:
+        add_check("skill_md_casing", False, f"Found wrong casing: {wrong_casing} (must be exactly SKILL.md)")
 
     if not has_skill_md:
         results["summary"] = "FAIL — SKILL.md not found"
-        return results
+        return results, None
 
     # --- Check 4: No README.md ---
-    has_readme = any(e.lower() == "readme.md" for e in entries)
+    has_readme = "readme.md" in entries_lower
     add_check(
         "no_readme",
         not has_readme,
@@ -286,23 +645,33 @@ def validate_skill(skill_path: str) -> dict:
 
     # --- Check 5: Parse frontmatter ---
     skill_path_full = os.path.join(skill_path, "SKILL.md")
-    with open(skill_path_full, "r", encoding="utf-8") as f:
-        content = f.read()
+    try:
+        with open(skill_path_full, "r", encoding="utf-8") as f:
+            fm_raw = read_frontmatter(f)
+            body = f.read() if fm_raw is not None else ""
+    except (OSError, UnicodeDecodeError) as e:
+        add_check("skill_md_readable", False, f"Cannot read SKILL.md: {e}")
+        results["summary"] = "FAIL — SKILL.md unreadable"
+        return results, None
 
     # Check for --- delimiters
-    fm_match = re.match(r"^---\s*\n(.*?)\n---\s*\n", content, re.DOTALL)
-    if not fm_match:
+    if fm_raw is None:
         add_check("frontmatter_delimiters", False, "Missing or malformed --- delimiters in frontmatter")
         results["summary"] = "FAIL — frontmatter parse error"
-        return results
+        return results, None
     add_check("frontmatter_delimiters", True, "YAML frontmatter delimiters present")
 
-    fm_raw = fm_match.group(1)
-
     try:
-        fm, parser_mode = parse_frontmatter(fm_raw)
+        cached_fm = load_frontmatter_cache(skill_path, fm_raw) if FM_CACHE_FILENAME in entries else None
+        fm, parser_mode = cached_fm if cached_fm is not None else parse_frontmatter(fm_raw)
         results["parser_mode"] = parser_mode
-        if parser_mode == "pyyaml":
+        if cached_fm is not None:
+            add_check(
+                "frontmatter_valid_yaml",
+                True,
+                f"Frontmatter loaded from {FM_CACHE_FILENAME} (validated with {parser_mode} by a previous --compile run)",
+            )
+        elif parser_mode.startswith("pyyaml"):
             add_check("frontmatter_valid_yaml", True, "Frontmatter is valid YAML (parsed with PyYAML)")
         else:
             add_check(
@@ -313,28 +682,30 @@ def validate_skill(skill_path: str) -> dict:
     except Exception as e:
         add_check("frontmatter_valid_yaml", False, f"YAML parse error: {e}")
         results["summary"] = "FAIL — YAML parse error"
-        return results
+        return results, None
 
     # --- Check 6: name field ---
     name = fm.get("name")
     if not name:
         add_check("name_present", False, "Missing 'name' field in frontmatter")
     else:
-        add_check("name_present", True, f"name: {name}")
-        is_name_kebab = bool(kebab_pattern.match(str(name)))
-        add_check("name_kebab_case", is_name_kebab, f"name '{name}' {'is' if is_name_kebab else 'is NOT'} kebab-case")
+        # Coerce once; YAML may hand back non-str scalars (e.g. numbers).
+        name_s = name if isinstance(name, str) else str(name)
+        add_check("name_present", True, f"name: {name_s}")
+        is_name_kebab = _is_kebab(name_s)
+        add_check("name_kebab_case", is_name_kebab, f"name '{name_s}' {'is' if is_name_kebab else 'is NOT'} kebab-case")
 
         # Check reserved names
-        name_lower = str(name).lower()
+        name_lower = name_s.lower()
         has_reserved = "claude" in name_lower or "anthropic" in name_lower
         add_check("name_not_reserved", not has_reserved, "Name does not use reserved terms" if not has_reserved else "Name contains 'claude' or 'anthropic' (reserved)")
 
         # Check name matches folder
-        names_match = str(name) == folder_name
+        names_match = name_s == folder_name
         add_check(
             "name_matches_folder",
             names_match,
-            f"name '{name}' matches folder '{folder_name}'" if names_match else f"name '{name}' does NOT match folder '{folder_name}'",
+            f"name '{name_s}' matches folder '{folder_name}'" if names_match else f"name '{name_s}' does NOT match folder '{folder_name}'",
             severity="warning",
         )
 
@@ -343,20 +714,21 @@ def validate_skill(skill_path: str) -> dict:
     if not desc:
         add_check("description_present", False, "Missing 'description' field in frontmatter")
     else:
-        desc_str = str(desc).strip()
-        add_check("description_present", True, f"description present ({len(desc_str)} chars)")
+        desc_str = (desc if isinstance(desc, str) else str(desc)).strip()
+        desc_lower = desc_str.lower()
+        desc_len = len(desc_str)
+        add_check("description_present", True, f"description present ({desc_len} chars)")
 
         # Length check
-        desc_ok_length = len(desc_str) <= 1024
-        add_check("description_length", desc_ok_length, f"Description length: {len(desc_str)}/1024 chars")
+        desc_ok_length = desc_len <= 1024
+        add_check("description_length", desc_ok_length, f"Description length: {desc_len}/1024 chars")
 
         # No XML brackets
         has_xml = "<" in desc_str or ">" in desc_str
         add_check("description_no_xml", not has_xml, "No XML brackets in description" if not has_xml else "XML angle brackets found in description (forbidden)")
 
         # Trigger phrase check
-        trigger_keywords = ["use when", "use for", "use this", "trigger", "ask for", "asks to", "says", "mentions"]
-        has_triggers = any(kw in desc_str.lower() for kw in trigger_keywords)
+        has_triggers = any(kw in desc_lower for kw in TRIGGER_KEYWORDS)
         add_check(
             "description_has_triggers",
             has_triggers,
@@ -364,8 +736,7 @@ def validate_skill(skill_path: str) -> dict:
         )
 
         # Negative scope check
-        negative_keywords = ["do not use", "don't use", "not for", "not intended for"]
-        has_negative_scope = any(kw in desc_str.lower() for kw in negative_keywords)
+        has_negative_scope = any(kw in desc_lower for kw in NEGATIVE_KEYWORDS)
         add_check(
             "description_has_negative_scope",
             has_negative_scope,
@@ -398,9 +769,8 @@ def validate_skill(skill_path: str) -> dict:
         )
 
     # --- Check 8: Body content ---
-    body = content[fm_match.end():]
-    body_lines = body.strip().split("\n")
-    line_count = len(body_lines)
+    # Same count as len(body.strip().split("\n")) without building the list.
+    line_count = body.strip().count("\n") + 1
 
     add_check(
         "body_line_count",
@@ -409,8 +779,10 @@ def validate_skill(skill_path: str) -> dict:
         severity="warning" if line_count > 500 else "error",
     )
 
+    body_lower = body.lower()
+
     # Check for examples
-    has_examples = bool(re.search(r"(?i)(example|user says|result:)", body))
+    has_examples = any(tok in body_lower for tok in _EXAMPLE_TOKENS)
     add_check(
         "body_has_examples",
         has_examples,
@@ -419,7 +791,7 @@ def validate_skill(skill_path: str) -> dict:
     )
 
     # Check for error handling
-    has_error_handling = bool(re.search(r"(?i)(error|fail|troubleshoot|issue|problem|if.*fails)", body))
+    has_error_handling = any(tok in body_lower for tok in _ERROR_TOKENS)
     add_check(
         "body_has_error_handling",
         has_error_handling,
@@ -428,8 +800,7 @@ def validate_skill(skill_path: str) -> dict:
     )
 
     # --- Check 9: Optional files ---
-    if "references" in entries and os.path.isdir(os.path.join(skill_path, "references")):
-        refs = os.listdir(os.path.join(skill_path, "references"))
+    if refs is not None:
         # Check if references are mentioned in body
         for ref in refs:
             ref_mentioned = ref in body or f"references/{ref}" in body
@@ -450,12 +821,22 @@ def validate_skill(skill_path: str) -> dict:
 
     if results["failed"] > 0:
         results["next_steps"] = [
-            f"Fix check '{check['name']}': {check['message']}"
+            f"Fix check '{check.name}': {check.message}"
             for check in results["checks"]
-            if (not check["passed"] and check["severity"] == "error")
+            if (not check.passed and check.severity == "error")
         ]
 
-    return results
+    return results, (fm_raw, fm, parser_mode)
+
+
+def read_batch_paths(batch_file: str) -> list[str]:
+    """Read newline-delimited skill paths from a file, or stdin when batch_file is '-'."""
+    if batch_file == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(batch_file, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    return [line.strip() for line in lines if line.strip()]
 
 
 def print_report(results: dict, verbose: bool = False):
@@ -467,10 +848,10 @@ def print_report(results: dict, verbose: bool = False):
     print(f"{'=' * 60}\n")
 
     for check in results["checks"]:
-        if check["passed"] and not verbose:
+        if check.passed and not verbose:
             continue
-        icon = "✅" if check["passed"] else ("⚠️" if check["severity"] == "warning" else "❌")
-        print(f"  {icon} {check['name']}: {check['message']}")
+        icon = "✅" if check.passed else ("⚠️" if check.severity == "warning" else "❌")
+        print(f"  {icon} {check.name}: {check.message}")
 
     print(f"\n{'─' * 60}")
     print(f"  {results['summary']}")
@@ -489,7 +870,12 @@ if __name__ == "__main__":
         description="Validate a skill folder",
         epilog="Tip: use --json-out FILE to save full results and avoid re-running for later feedback.",
     )
-    parser.add_argument("path", help="Path to the skill folder")
+    parser.add_argument("path", nargs="?", help="Path to the skill folder")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Validate newline-delimited skill paths from FILE ('-' for stdin); JSON output becomes an array",
+    )
     parser.add_argument(
         "--format",
         choices=["human", "json", "both"],
@@ -510,30 +896,59 @@ if __name__ == "__main__":
         "--json-out",
         help="Write JSON report to a file (compact by default)",
     )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help=f"On success, cache parsed frontmatter in {FM_CACHE_FILENAME} so later runs skip YAML parsing",
+    )
     args = parser.parse_args()
 
-    results = validate_skill(args.path)
+    if (args.path is None) == (args.batch is None):
+        parser.error("provide either a skill folder path or --batch FILE")
+
+    batch_mode = args.batch is not None
+    try:
+        paths = read_batch_paths(args.batch) if batch_mode else [args.path]
+    except OSError as e:
+        parser.error(f"cannot read --batch file: {e}")
+    if not paths:
+        parser.error(f"--batch {args.batch!r} contains no skill paths")
+    runs = [_validate_skill_with_frontmatter(path) for path in paths]
+    all_results = [results for results, _ in runs]
+    report = all_results if batch_mode else all_results[0]
 
     if args.format in {"human", "both"}:
-        print_report(results, verbose=args.verbose)
+        for results in all_results:
+            print_report(results, verbose=args.verbose)
         if not args.json_out:
             print("  Tip: add --json-out FILE to reuse this report without re-running.\n")
 
+    indent = 2 if args.pretty_json else None
+    separators = None if args.pretty_json else (",", ":")
+
     if args.format in {"json", "both"}:
         if args.format == "both":
             print("--- JSON Report ---")
-        indent = 2 if args.pretty_json else None
-        separators = None if args.pretty_json else (",", ":")
-        report_json = json.dumps(results, indent=indent, separators=separators)
+        report_json = json.dumps(report, indent=indent, separators=separators, default=json_default)
         print(report_json)
 
     if args.json_out:
-        indent = 2 if args.pretty_json else None
-        separators = None if args.pretty_json else (",", ":")
-        report_json = json.dumps(results, indent=indent, separators=separators)
+        report_json = json.dumps(report, indent=indent, separators=separators, default=json_default)
         with open(args.json_out, "w", encoding="utf-8") as out_file:
             out_file.write(report_json)
         if args.format in {"human", "both"}:
             print(f"  JSON report saved to: {args.json_out}")
 
-    sys.exit(0 if results["failed"] == 0 else 1)
+    if args.compile:
+        for path, (results, frontmatter) in zip(paths, runs):
+            if results["failed"] != 0 or frontmatter is None:
+                continue
+            try:
+                cache_path = write_frontmatter_cache(path, *frontmatter)
+            except FrontmatterParseError as e:
+                print(f"Warning: frontmatter cache not written for {path}: {e}", file=sys.stderr)
+                continue
+            if args.format in {"human", "both"}:
+                print(f"  Frontmatter cache saved to: {cache_path}")
+
+    sys.exit(0 if all(results["failed"] == 0 for results in all_results) else 1)